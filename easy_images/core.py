@@ -30,6 +30,10 @@ option_defaults: ImgOptions = {
 
 
 class Img:
+    # Instances are callable, but templates need the instance itself (e.g. to pass to
+    # the ``{% img %}`` tag).
+    do_not_call_in_templates = True
+
     def __init__(self, **options: Unpack[ImgOptions]):
         all_options = option_defaults.copy()
         all_options.update(options)
@@ -118,12 +122,9 @@ class BoundImg:
         if "width" in img.options and img.options["width"] is not None:
             base_options = ParsedOptions(file.instance, **img.options)
             base_options.mimetype = "image/jpeg"
-            self.base, created = EasyImage.objects.from_file(file, base_options)
-            if created and not build:
-                queued = True
             base_width = base_options.width
         else:
-            self.base = None
+            base_options = None
             base_width = None
 
         densities = img.options.get("densities") or []
@@ -137,7 +138,8 @@ class BoundImg:
             source_type = mimetypes.guess_type(file.name)[0]
             options["mimetype"] = source_type or "image/jpeg"
 
-        srcset: list[SrcSetItem] = []
+        srcset_options: list[Options] = []
+        srcset_parsed: list[ParsedOptions] = []
         sizes_attr: list[str] = []
 
         sizes = img.options.get("sizes")
@@ -162,55 +164,52 @@ class BoundImg:
                     max_options = media_options
                     max_width = max_width
                 sizes_attr.append(f"{media} {parsed_options.width}px")
-                instance, created = EasyImage.objects.from_file(
-                    file, ParsedOptions(file.instance, **media_options)
-                )
-
-                srcset.append(SrcSetItem(instance, media_options))
-                if created and build != "srcset":
-                    queued = True
-            instance, created = EasyImage.objects.from_file(
-                file, ParsedOptions(file.instance, **img_options)
-            )
-            srcset.append(SrcSetItem(instance, img_options))
-            if created and build != "srcset":
-                queued = True
+                srcset_options.append(media_options)
+                srcset_parsed.append(parsed_options)
+            srcset_options.append(img_options)
+            srcset_parsed.append(ParsedOptions(file.instance, **img_options))
             sizes_attr.append(f"{max_width}px")
             max_density = max(densities) if densities else 1
             if max_density > 1:
                 # Find the max size and multiply it by the max density to get an extra size that should be generated.
                 high_density_options = max_options.copy()
                 high_density_options["width_multiplier"] = max_density
-                instance, created = EasyImage.objects.from_file(
-                    file, ParsedOptions(file.instance, **high_density_options)
+                srcset_options.append(high_density_options)
+                srcset_parsed.append(
+                    ParsedOptions(file.instance, **high_density_options)
                 )
-                srcset.append(SrcSetItem(instance, high_density_options))
-                if created and build != "srcset":
-                    queued = True
         elif densities:
             for density in densities:
                 alt_options = options.copy()
                 alt_options["width_multiplier"] = density
-                instance, created = EasyImage.objects.from_file(
-                    file, ParsedOptions(file.instance, **alt_options)
-                )
-                srcset.append(SrcSetItem(instance, alt_options))
-                if created and build != "srcset":
-                    queued = True
+                srcset_options.append(alt_options)
+                srcset_parsed.append(ParsedOptions(file.instance, **alt_options))
+
+        # Fetch (or queue) the base image and all srcset images in one go.
+        lookups = [(file, parsed) for parsed in srcset_parsed]
+        if base_options:
+            lookups.insert(0, (file, base_options))
+        images = EasyImage.objects.from_files(lookups)
+        if base_options:
+            (self.base, created), *images = images
+            if created and not build:
+                queued = True
+        else:
+            self.base = None
+        srcset: list[SrcSetItem] = []
+        for srcset_item_options, (instance, created) in zip(srcset_options, images):
+            srcset.append(SrcSetItem(instance, srcset_item_options))
+            if created and build != "srcset":
+                queued = True
 
         if build:
             build_options: list[tuple[EasyImage, ParsedOptions]] = []
             if build == "srcset":
-                for srcset_item in srcset:
+                for srcset_item, parsed in zip(srcset, srcset_parsed):
                     if srcset_item.thumb.image:
                         continue
-                    build_options.append(
-                        (
-                            srcset_item.thumb,
-                            ParsedOptions(file.instance, **srcset_item.options),
-                        )
-                    )
-            if self.base:
+                    build_options.append((srcset_item.thumb, parsed))
+            if self.base and base_options:
                 build_options.append((self.base, base_options))
             if build_options:
                 try:
@@ -113,8 +113,12 @@ def efficient_load(
     img = _new_image(file, access=access)
     if not options:
         return img
-    x_scale = img.width / max(opt.source_x(img.width) for opt in options)
-    y_scale = img.height / max(opt.source_y(img.height) for opt in options)
+    sizes = [(opt.source_x(img.width), opt.source_y(img.height)) for opt in options]
+    if not all(x and y for x, y in sizes):
+        # A target without a size (e.g. no width) needs the full size source.
+        return img
+    x_scale = img.width / max(x for x, _ in sizes)
+    y_scale = img.height / max(y for _, y in sizes)
     min_scale = min(x_scale, y_scale) / 3  # At least 3x of the target size
     if min_scale < 2:
         return img
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("easy_images", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="easyimage",
+            index=models.Index(
+                condition=models.Q(("image", "")),
+                fields=["status"],
+                name="easy_images_unbuilt_status",
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import cast
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 import django_stubs_ext
 from django.core.files.storage import (
@@ -9,8 +10,10 @@ from django.core.files.storage import (
     storages,  # type: ignore (storages isn't in the stubs)
 )
 from django.core.files.storage.handler import InvalidStorageError
+from django.core.signals import setting_changed
 from django.db import models
 from django.db.models.fields.files import FieldFile, ImageFieldFile
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -20,6 +23,13 @@ from easy_images.options import ParsedOptions
 django_stubs_ext.monkeypatch()
 
 
+mimetype_extensions = {
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/avif": ".avif",
+}
+
+
 def pick_image_storage() -> Storage:
     try:
         return storages["easy_images"]
@@ -31,9 +41,26 @@ def image_name_and_storage(file: FieldFile) -> tuple[str, str]:
     return file.name, get_storage_name(file.storage)
 
 
+_storage_names: WeakKeyDictionary[Storage, str] = WeakKeyDictionary()
+
+
+@receiver(setting_changed)
+def _clear_storage_names(*, setting, **kwargs):
+    if setting == "STORAGES":
+        _storage_names.clear()
+
+
 def get_storage_name(storage: Storage) -> str:
+    try:
+        return _storage_names[storage]
+    except (KeyError, TypeError):
+        pass
     for name in storages.backends:
         if storage == storages[name]:
+            try:
+                _storage_names[storage] = name
+            except TypeError:
+                pass
             return name
     raise ValueError(f"Unknown storage: {storages}")
 
@@ -47,7 +74,7 @@ class EasyImageManager(models.Manager["EasyImage"]):
     def from_file(self, file: FieldFile, options: ParsedOptions):
         name, storage = image_name_and_storage(file)
         pk = self.hash(name=name, storage=storage, options=options)
-        return self.get_or_create(
+        instance, created = self.get_or_create(
             pk=pk,
             defaults=dict(
                 storage=storage,
@@ -55,10 +82,57 @@ class EasyImageManager(models.Manager["EasyImage"]):
                 args=options.to_dict(),
             ),
         )
+        instance._parsed_options = options
+        return instance, created
+
+    def from_files(
+        self, files: list[tuple[FieldFile, ParsedOptions]]
+    ) -> list[tuple[EasyImage, bool]]:
+        """
+        A batched version of ``from_file``.
 
-    def all_for_file(self, file: FieldFile):
+        Looks up all the images with a single query and creates any missing ones with
+        a single bulk insert.
+
+        :param files: A list of ``(file, options)`` pairs.
+        :return: A list of ``(instance, created)`` tuples, in the same order.
+        """
+        keys = []
+        for file, options in files:
+            name, storage = image_name_and_storage(file)
+            pk = self.hash(name=name, storage=storage, options=options)
+            keys.append((pk, name, storage, options))
+        existing = self.in_bulk([pk for pk, *_ in keys])
+        missing: dict[UUID, EasyImage] = {}
+        results: list[tuple[EasyImage, bool]] = []
+        for pk, name, storage, options in keys:
+            if pk in existing:
+                instance, created = existing[pk], False
+            elif pk in missing:
+                instance, created = missing[pk], True
+            else:
+                instance = missing[pk] = self.model(
+                    pk=pk, storage=storage, name=name, args=options.to_dict()
+                )
+                created = True
+            instance._parsed_options = options
+            results.append((instance, created))
+        if missing:
+            self.bulk_create(missing.values(), ignore_conflicts=True)
+        return results
+
+    def all_for_file(self, file: FieldFile, with_args: bool = False):
+        """
+        Get all the images for a file.
+
+        :param file: The source file.
+        :param with_args: Also load the ``args`` of each image (deferred by default).
+        """
         name, storage = image_name_and_storage(file)
-        return self.filter(name=name, storage=storage)
+        images = self.filter(name=name, storage=storage)
+        if not with_args:
+            images = images.defer("args")
+        return images
 
 
 class ImageStatus(models.IntegerChoices):
@@ -90,12 +164,19 @@ class EasyImage(models.Model):
 
     objects: EasyImageManager = EasyImageManager()
 
+    # The options this image was looked up with, to avoid parsing ``args`` again.
+    _parsed_options: ParsedOptions | None = None
+
+    # The only fields that build() changes, so saves can issue a narrow UPDATE.
+    _built_fields = ("image", "width", "height", "status", "status_changed_date")
+    _error_fields = ("error_count", "status", "status_changed_date")
+
     def save(self, *args, **kwargs):
         if not self.id:
             self.id = EasyImage.objects.hash(
                 name=self.name,
                 storage=self.storage,
-                options=ParsedOptions(**self.args),
+                options=self._parsed_options or ParsedOptions.from_dict(self.args),
             )
         super().save(*args, **kwargs)
 
@@ -105,6 +186,8 @@ class EasyImage(models.Model):
         options: ParsedOptions | None = None,
         force=False,
     ):
+        if not options:
+            options = self._parsed_options
         now = timezone.now()
         if force:
             EasyImage.objects.filter(pk=self.pk).update(
@@ -126,11 +209,11 @@ class EasyImage(models.Model):
                 self.error_count += 1
                 self.status = ImageStatus.SOURCE_ERROR
                 self.status_changed_date = timezone.now()
-                self.save()
+                self.save(update_fields=self._error_fields)
                 return False
         try:
             if not options:
-                options = ParsedOptions(**self.args)
+                options = ParsedOptions.from_dict(self.args)
             if size := options.size:
                 scale_args = {}
                 if options.window:
@@ -142,11 +225,7 @@ class EasyImage(models.Model):
                 img = source_img
             self.height = img.height
             self.width = img.width
-            extension = {
-                "image/jpeg": ".jpg",
-                "image/webp": ".webp",
-                "image/avif": ".avif",
-            }.get(options.mimetype or "", ".jpg")
+            extension = mimetype_extensions.get(options.mimetype or "", ".jpg")
             file = engine.vips_to_django(
                 img, f"{self.id.hex}{extension}", quality=options.quality
             )
@@ -154,7 +233,7 @@ class EasyImage(models.Model):
             self.error_count += 1
             self.status = ImageStatus.BUILD_ERROR
             self.status_changed_date = timezone.now()
-            self.save()
+            self.save(update_fields=self._error_fields)
             return False
         self.image = cast(
             ImageFieldFile,  # Avoid some typing issues
@@ -162,7 +241,7 @@ class EasyImage(models.Model):
         )
         self.status = ImageStatus.BUILT
         self.status_changed_date = timezone.now()
-        self.save()
+        self.save(update_fields=self._built_fields)
         file.close()
         return True
 
@@ -171,4 +250,10 @@ class EasyImage(models.Model):
             models.Index(
                 fields=["storage", "name"], name="easy_images_storage_and_name"
             ),
+            # Keeps finding images still needing to be built fast as the table grows.
+            models.Index(
+                fields=["status"],
+                condition=models.Q(image=""),
+                name="easy_images_unbuilt_status",
+            ),
         ]
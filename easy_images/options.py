@@ -1,6 +1,9 @@
 import json
+import math
+from functools import lru_cache
 from hashlib import sha256
-from typing import cast
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, cast
 
 from django.template import Context, Variable
 from django.utils.text import smart_split
@@ -38,6 +41,74 @@ ratio_options: dict[str, float] = {
 }
 
 
+def _json_value(value) -> str:
+    """
+    Serialize a parsed option value exactly like ``json.dumps`` would.
+    """
+    if value is None:
+        return "null"
+    if type(value) is int or (type(value) is float and math.isfinite(value)):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        return f"[{', '.join(_json_value(v) for v in value)}]"
+    return json.dumps(value)
+
+
+# The string parsers are cached since there are only ever a handful of distinct values
+# (mostly the named options above) used across a site.
+
+
+@lru_cache(maxsize=256)
+def _parse_crop_str(value: str) -> tuple[float, float]:
+    if value in crop_options:
+        return crop_options[value]
+    parts = value.split(",")
+    if len(parts) == 2:
+        try:
+            return (float(parts[0]), float(parts[1]))
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid crop value {value}")
+
+
+@lru_cache(maxsize=256)
+def _parse_width_str(value: str) -> int:
+    if value in width_options:
+        return width_options[value]
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Invalid width value {value}")
+
+
+@lru_cache(maxsize=256)
+def _parse_ratio_str(value: str) -> float:
+    if value in ratio_options:
+        return ratio_options[value]
+    parts = value.split("/")
+    try:
+        if len(parts) == 2:
+            return float(parts[0]) / float(parts[1])
+        return float(value)
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"Invalid ratio value {value}")
+
+
+def _split_option(part: str) -> tuple[str, str]:
+    key, sep, value = part.partition("=")
+    if not sep:
+        raise ValueError(f"Invalid option {part!r}, expected key=value")
+    return key, value
+
+
+def _is_numbers(value, length: int) -> bool:
+    return (
+        isinstance(value, (tuple, list))
+        and len(value) == length
+        and all(type(n) in (int, float) for n in value)
+    )
+
+
 class ParsedOptions:
     __slots__ = ("quality", "crop", "window", "width", "ratio", "mimetype")
 
@@ -48,31 +119,72 @@ class ParsedOptions:
     ratio: float | None
     mimetype: str | None
 
+    _parsers: ClassVar[dict[str, Callable[..., Any]]]
+
     def __init__(self, bound=None, string="", /, **options):
         if string:
             for part in smart_split(string):
-                key, value = part.split("=", 1)
+                key, value = _split_option(part)
                 if key not in options:
                     options[key] = Variable(value)
-        context = Context()
-        if bound:
-            for key, value in bound.__dict__.items():
-                context[key] = value
-        for key in self.__slots__:
+        # Only build a context if there are actually variables to resolve.
+        context = None
+        for key, parse_func in self._parsers.items():
             value = options.get(key)
             if isinstance(value, Variable):
+                if context is None:
+                    context = Context()
+                    if bound:
+                        for attr, attr_value in bound.__dict__.items():
+                            context[attr] = attr_value
                 value = value.resolve(context)
             if value and value != 0:
-                parse_func = getattr(self, f"parse_{key}")
                 setattr(self, key, parse_func(value, **options))
             else:
                 setattr(self, key, 80 if key == "quality" else None)
 
+    @classmethod
+    def from_dict(cls, options: dict):
+        """
+        Rebuild options from the output of ``to_dict`` (e.g. ``EasyImage.args``).
+
+        Values that are already normalized are used directly rather than going back
+        through the parsers. Anything else falls back to being fully parsed.
+        """
+        quality = options.get("quality")
+        crop = options.get("crop")
+        window = options.get("window")
+        width = options.get("width")
+        ratio = options.get("ratio")
+        mimetype = options.get("mimetype")
+        if not (
+            options.keys() <= _slot_names
+            and (not quality or type(quality) is int)
+            and (not crop or _is_numbers(crop, 2))
+            and (not window or _is_numbers(window, 4))
+            and (not width or type(width) is int)
+            and (not ratio or type(ratio) in (int, float))
+            and (not mimetype or type(mimetype) is str)
+        ):
+            return cls(**options)
+        self = cls.__new__(cls)
+        self.quality = quality or 80
+        self.crop = cast(tuple[float, float], tuple(map(float, crop))) if crop else None
+        self.window = (
+            cast(tuple[float, float, float, float], tuple(map(float, window)))
+            if window
+            else None
+        )
+        self.width = width or None
+        self.ratio = float(ratio) if ratio else None
+        self.mimetype = mimetype or None
+        return self
+
     @classmethod
     def from_str(cls, s: str):
         str_options: dict[str, str] = {}
         for part in s.split(" "):
-            key, value = part.split("=", 1)
+            key, value = _split_option(part)
             str_options[key] = value
         return cls(**str_options)
 
@@ -89,13 +201,13 @@ class ParsedOptions:
     def parse_crop(value, **options) -> tuple[float, float]:
         if value is True:
             return (0.5, 0.5)
+        if isinstance(value, str):
+            return _parse_crop_str(value)
         try:
             if value in crop_options:
                 return crop_options[value]
         except TypeError:
             pass
-        if isinstance(value, str):
-            value = value.split(",")
         if isinstance(value, (tuple, list)) and len(value) == 2:
             try:
                 return cast(tuple[float, float], tuple(float(n) for n in value))
@@ -118,12 +230,13 @@ class ParsedOptions:
 
     @staticmethod
     def parse_width(value, **options) -> int:
-        if value in width_options:
-            value = width_options[value]
-        try:
-            value = int(value)
-        except (ValueError, TypeError):
-            raise ValueError(f"Invalid width value {value}")
+        if isinstance(value, str):
+            value = _parse_width_str(value)
+        else:
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                raise ValueError(f"Invalid width value {value}")
         if multiplier := options.get("width_multiplier"):
             try:
                 value = int(value * multiplier)
@@ -133,10 +246,8 @@ class ParsedOptions:
 
     @staticmethod
     def parse_ratio(value, **options) -> float:
-        if value in ratio_options:
-            return ratio_options[value]
         if isinstance(value, str):
-            value = value.split("/")
+            return _parse_ratio_str(value)
         if isinstance(value, (tuple, list)) and len(value) == 2:
             try:
                 return float(value[0]) / float(value[1])
@@ -154,10 +265,24 @@ class ParsedOptions:
         return str(value)
 
     def __str__(self):
-        return json.dumps(self.to_dict(), sort_keys=True)
+        return self._hash_bytes().decode()
+
+    def _hash_bytes(self) -> bytes:
+        """
+        The canonical serialization of these options, used as the hash input.
+
+        This is built directly from the slot values but is identical to
+        ``json.dumps(self.to_dict(), sort_keys=True)`` so that existing hashes (and
+        therefore ``EasyImage`` primary keys) stay stable.
+        """
+        items = ", ".join(
+            f'"{key}": {_json_value(value)}'
+            for key, value in zip(_sorted_slots, _get_sorted_slot_values(self))
+        )
+        return f"{{{items}}}".encode()
 
     def hash(self):
-        return sha256(str(self).encode(), usedforsecurity=False)
+        return sha256(self._hash_bytes(), usedforsecurity=False)
 
     @property
     def size(self):
@@ -166,7 +291,7 @@ class ParsedOptions:
         return self.width, int(self.width / self.ratio)
 
     def to_dict(self):
-        return {key: getattr(self, key) for key in self.__slots__}
+        return dict(zip(self.__slots__, _get_slot_values(self)))
 
     def source_x(self, source_x: int):
         if self.window:
@@ -179,3 +304,12 @@ class ParsedOptions:
         if not self.width or not self.ratio:
             return 0
         return int(self.width / self.ratio)
+
+
+ParsedOptions._parsers = {
+    key: getattr(ParsedOptions, f"parse_{key}") for key in ParsedOptions.__slots__
+}
+_slot_names = frozenset(ParsedOptions.__slots__)
+_sorted_slots = tuple(sorted(ParsedOptions.__slots__))
+_get_slot_values = attrgetter(*ParsedOptions.__slots__)
+_get_sorted_slot_values = attrgetter(*_sorted_slots)
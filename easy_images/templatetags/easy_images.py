@@ -1,7 +1,9 @@
-from typing import cast
+from functools import lru_cache
+from typing import Any, cast
 
 from django import template
-from django.template.base import token_kwargs
+from django.template.base import FilterExpression, Variable, token_kwargs
+from django.utils.safestring import mark_safe
 
 from easy_images.core import Img
 from easy_images.options import ParsedOptions
@@ -10,51 +12,136 @@ from easy_images.types import ImgOptions
 register = template.Library()
 
 
+# Options the tag handles itself, rather than passing through to ParsedOptions.
+tag_option_keys = frozenset({"alt", "densities", "size", "format"})
+parsed_option_keys = frozenset(ParsedOptions.__slots__)
+
+
+def _is_literal(value: FilterExpression) -> bool:
+    """
+    Whether a compiled tag argument is a constant (e.g. ``"md"`` or ``100``).
+    """
+    if value.filters:
+        return False
+    var = value.var
+    return not isinstance(var, Variable) or (var.lookups is None and not var.translate)
+
+
+@lru_cache(maxsize=256)
+def _parse_options(
+    items: tuple[tuple[str, type, Any], ...],
+) -> tuple[tuple[str, Any], ...]:
+    """
+    Parse tag options, returning the items that were given and aren't ``None``.
+
+    This is cached since the same tag is usually rendered with the same options many
+    times (e.g. in a loop). Each item includes its value's type so that equal values
+    which parse differently (e.g. ``True`` and ``1``) don't share a cache entry.
+    """
+    options = {key: value for key, _, value in items}
+    parsed = ParsedOptions(**options)
+    return tuple(
+        (key, value)
+        for key, value in parsed.to_dict().items()
+        if key in options and value is not None
+    )
+
+
+def _option_kind(key: str) -> str | None:
+    if key in parsed_option_keys:
+        return "parsed"
+    if key.startswith("img_"):
+        return "img_attr"
+    if key in tag_option_keys:
+        return key
+    return None
+
+
 class ImgNode(template.Node):
     def __init__(self, file, img_instance, options, as_var):
         self.file = file
         self.img_instance = img_instance
         self.options = options
         self.as_var = as_var
+        # Work out what each option is used for once, at compile time.
+        kinds = {key: _option_kind(key) for key in options}
+        unknown = [key for key, kind in kinds.items() if kind is None]
+        if unknown:
+            raise template.TemplateSyntaxError(
+                f"Invalid img option{'s' if len(unknown) > 1 else ''}:"
+                f" {', '.join(sorted(unknown))}"
+            )
+        option_items = []
+        for key, value in options.items():
+            kind = kinds[key]
+            if kind == "img_attr":
+                # Store under the HTML attribute name, e.g. img_data_id -> data-id
+                key = key[4:].replace("_", "-")
+            if _is_literal(value):
+                # Literal values never change, so resolve them once up front.
+                value = value.resolve(template.Context())
+                option_items.append((key, kind, value, False))
+            else:
+                option_items.append((key, kind, value, True))
+        self.option_items = tuple(option_items)
 
     def render(self, context):
         file = self.file.resolve(context)
-        resolved_options = {key: value.resolve(context) for key, value in self.options}
-        base_opts = ParsedOptions(**resolved_options)
-        options = cast(
-            ImgOptions,
-            {
-                key: getattr(base_opts, key)
-                for key in ParsedOptions.__slots__
-                if getattr(base_opts, key) is not None
-            },
-        )
+        parsed_options = {}
         img_attrs = {}
-        for key, value in resolved_options.items():
-            if key.startswith("img_"):
-                img_attrs[key[4:]] = value
-            elif key == "densities":
-                options["densities"] = (
-                    [float(d) for d in value.split(",")]
-                    if isinstance(value, str)
-                    else value
-                )
-            elif key == "size":
+        extra_options: ImgOptions = {}
+        alt = ""
+        for key, kind, value, resolvable in self.option_items:
+            if resolvable:
+                value = value.resolve(context)
+            if kind == "parsed":
+                parsed_options[key] = value
+            elif kind == "img_attr":
+                img_attrs[key] = value
+            elif kind == "alt":
+                # Convert lazy translations (e.g. alt=_("Photo")) to a string.
+                alt = "" if value is None else str(value)
+            elif kind == "densities":
+                if isinstance(value, str):
+                    value = [float(d) for d in value.split(",")]
+                elif isinstance(value, (int, float)):
+                    value = [float(value)]
+                extra_options["densities"] = value
+            elif kind == "size":
                 if not isinstance(value, str) or "," not in value:
                     raise ValueError(
                         "size must be a string with a comma between the media and size"
                     )
-                sizes = options.setdefault("sizes", {})
+                sizes = extra_options.setdefault("sizes", {})
                 size_key, value = value.split(",")
                 if size_key.isdigit():
                     size_key = int(size_key)
                 sizes[size_key] = int(value)
-            elif key == "format":
-                options["format"] = value
             else:
-                raise ValueError(f"Invalid option {key}")
-        options["img_attrs"] = img_attrs
-        output = Img(**options)(file, alt=resolved_options["alt"]).as_html()
+                extra_options["format"] = value
+        parsed_items = tuple(
+            (key, type(value), value) for key, value in sorted(parsed_options.items())
+        )
+        try:
+            options = cast(ImgOptions, dict(_parse_options(parsed_items)))
+        except TypeError:
+            # Unhashable option values can't be cached.
+            options = cast(ImgOptions, dict(_parse_options.__wrapped__(parsed_items)))
+        options.update(extra_options)
+        if self.img_instance:
+            img = self.img_instance.resolve(context)
+            if not isinstance(img, Img):
+                raise ValueError(f"Expected an Img instance, got {img!r}")
+            if img_attrs:
+                options["img_attrs"] = {
+                    **(img.options.get("img_attrs") or {}),
+                    **img_attrs,
+                }
+            img = img.extend(**options)
+        else:
+            options["img_attrs"] = img_attrs
+            img = Img(**options)
+        output = mark_safe(img(file, alt=alt).as_html())
         if self.as_var:
             context[self.as_var] = output
             return ""
@@ -72,6 +159,7 @@ def img(parser, token):
             f"{bits[0]} tag requires an Img instance or options"
         )
     options = bits[2:]
+    img_instance = None
     if "=" not in options[0]:
         img_instance = parser.compile_filter(options[0])
         options = options[1:]
@@ -21,3 +21,9 @@ STORAGES = {
 
 USE_TZ = True
 SECRET_KEY = "test"
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+    }
+]
@@ -129,6 +129,10 @@ def test_build():
     img.build()
     assert img.image
     assert (img.width, img.height) == (200, 200)
+    img.refresh_from_db()
+    assert img.status == ImageStatus.BUILT
+    assert img.image
+    assert (img.width, img.height) == (200, 200)
 
 
 @pytest.mark.django_db
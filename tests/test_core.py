@@ -37,3 +37,15 @@ def test_sizes():
         ' srcset="/image/avif100.image 100w, /image/avif200.image 200w, /image/avif400.image 400w"'
         ' sizes="(max-width: 800px) 100px, 200px" alt="">'
     )
+
+
+@pytest.mark.django_db
+def test_batched_queries(django_assert_num_queries):
+    generator = Img(width=200, sizes={800: 100})
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    # One lookup, one bulk insert of the missing images.
+    with django_assert_num_queries(2):
+        generator(source)
+    assert EasyImage.objects.count() == 4
+    with django_assert_num_queries(1):
+        generator(source)
@@ -44,6 +44,12 @@ def test_efficient_load():
             image_path, [ParsedOptions(width=5000, ratio="square")]
         )
         assert (e_image.width, e_image.height) == (1000, 1000)
+        # A target without a width needs the full size image
+        e_image = efficient_load(
+            image_path,
+            [ParsedOptions(width=100, ratio="video"), ParsedOptions()],
+        )
+        assert (e_image.width, e_image.height) == (1000, 1000)
 
 
 def test_efficient_load_from_memory():
@@ -1,7 +1,10 @@
 from io import BytesIO
 
 import pytest
+from django.core.files.storage import FileSystemStorage, default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
 
 from easy_images.core import Img
 from easy_images.models import (
@@ -10,6 +13,7 @@ from easy_images.models import (
     get_storage_name,
     pick_image_storage,
 )
+from easy_images.options import ParsedOptions
 from pyvips.vimage import Image
 from tests.easy_images_tests.models import Profile
 
@@ -29,6 +33,9 @@ def test_build_bad_source():
     assert image.status == ImageStatus.SOURCE_ERROR
     assert not image.image
     assert image.error_count == 1
+    image.refresh_from_db()
+    assert image.status == ImageStatus.SOURCE_ERROR
+    assert image.error_count == 1
 
 
 @pytest.mark.django_db
@@ -64,3 +71,46 @@ def test_build_from_filefield_with_build():
     thumb = thumbnail(profile.image, build="src")
     assert thumb.base_url().endswith(".jpg")
     assert thumb.as_html() == f'<img src="{thumb.base_url()}" alt="">'
+
+
+@pytest.mark.django_db
+def test_build_without_width():
+    image = Image.black(1000, 1000)
+    file = SimpleUploadedFile("test.png", image.write_to_buffer(".png[Q=90]"))
+    profile = Profile.objects.create(name="Test", image=file)
+
+    options = ParsedOptions(mimetype="image/webp")
+    easy_image, _ = EasyImage.objects.from_file(profile.image, options)
+    assert easy_image.build()
+    assert easy_image.status == ImageStatus.BUILT
+    assert (easy_image.width, easy_image.height) == (1000, 1000)
+
+
+def test_get_storage_name():
+    assert get_storage_name(default_storage) == "default"
+    # A second lookup is served from the cache.
+    assert get_storage_name(default_storage) == "default"
+    with pytest.raises(ValueError):
+        get_storage_name(FileSystemStorage())
+
+
+@pytest.mark.django_db
+def test_all_for_file():
+    image = Image.black(1000, 1000)
+    file = SimpleUploadedFile("test.png", image.write_to_buffer(".png[Q=90]"))
+    profile = Profile.objects.create(name="Test", image=file)
+    thumbnail(profile.image)
+
+    images = EasyImage.objects.all_for_file(profile.image)
+    assert len(images) == 3
+    assert "args" in images[0].get_deferred_fields()
+    images = EasyImage.objects.all_for_file(profile.image, with_args=True)
+    assert not images[0].get_deferred_fields()
+
+
+@pytest.mark.django_db
+@override_settings(MIGRATION_MODULES={})
+def test_migrations_up_to_date():
+    # Tests run with --no-migrations, so make sure the migrations still match the
+    # models.
+    call_command("makemigrations", "easy_images", check=True, dry_run=True)
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from easy_images.options import ParsedOptions
@@ -50,3 +52,77 @@ def test_hash():
         ParsedOptions(quality=80).hash().hexdigest()
         == "cce6431a80fe3a84c7ea9f6c5293cbce4ed8848349bb0f2182eb6bb0d7a19f78"
     )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"quality": 90, "width": "md", "ratio": "square"},
+        {"crop": "tl", "ratio": "3/4", "mimetype": "image/avif"},
+        {"window": "0.1,0.2,0.8,0.9", "crop": True, "width": 100},
+        {"width": 100, "width_multiplier": 1.5, "ratio": "video"},
+    ],
+)
+def test_str_matches_json(options):
+    parsed = ParsedOptions(**options)
+    assert str(parsed) == json.dumps(parsed.to_dict(), sort_keys=True)
+
+
+def test_string_options_resolve_from_bound():
+    class Bound:
+        def __init__(self):
+            self.size = 200
+
+    options = ParsedOptions(Bound(), 'width=size ratio="square"')
+    assert options.width == 200
+    assert options.ratio == 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"crop": "middle"},
+        {"crop": "1,2,3"},
+        {"width": "huge"},
+        {"ratio": "wide"},
+        {"ratio": "1/0"},
+    ],
+)
+def test_invalid_string_options(options):
+    with pytest.raises(ValueError):
+        ParsedOptions(**options)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"quality": 90, "width": "md", "ratio": "square", "crop": "tl"},
+        {"window": "0.1,0.2,0.8,0.9", "crop": True, "width": 100},
+        {"width": 100, "width_multiplier": 1.5, "ratio": "video"},
+        {"mimetype": "image/avif", "crop": False},
+    ],
+)
+def test_from_dict(options):
+    parsed = ParsedOptions(**options)
+    stored = json.loads(json.dumps(parsed.to_dict()))
+    assert ParsedOptions.from_dict(stored).to_dict() == parsed.to_dict()
+    assert ParsedOptions.from_dict(stored).hash().digest() == (
+        ParsedOptions(**stored).hash().digest()
+    )
+
+
+def test_from_dict_unnormalized():
+    options = ParsedOptions.from_dict({"width": "md", "ratio": "3/4", "crop": "t"})
+    assert options.width == 448
+    assert options.ratio == 0.75
+    assert options.crop == (0.5, 0)
+
+
+def test_from_str():
+    options = ParsedOptions.from_str("width=md ratio=square")
+    assert options.width == 448
+    assert options.ratio == 1
+    with pytest.raises(ValueError):
+        ParsedOptions.from_str("width=md square")
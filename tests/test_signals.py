@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -55,7 +55,7 @@ def test_queued_img_signal():
     img = Img(width=100, densities=[])
     img.queue(Profile, fields=None)
 
-    handler = MagicMock()
+    handler = Mock()
     queued_img.connect(handler)
 
     Profile.objects.create(
@@ -0,0 +1,163 @@
+from functools import lru_cache
+
+import pytest
+from django.db.models import F, FileField, Value
+from django.db.models.fields.files import FieldFile
+from django.db.models.functions import Concat
+from django.template import Context, Template, TemplateSyntaxError
+
+from easy_images.core import Img
+from easy_images.models import EasyImage
+
+
+@lru_cache(maxsize=None)
+def get_template(template: str) -> Template:
+    return Template("{% load easy_images %}" + template)
+
+
+def render(template: str, **context):
+    return get_template(template).render(Context(context))
+
+
+@pytest.mark.django_db
+def test_img():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    output = render('{% img source width=100 alt="Test" %}', source=source)
+    assert output == '<img src="/test.jpg" alt="Test">'
+    EasyImage.objects.update(
+        image=Concat(F("args__mimetype"), F("args__width"), Value(".image")),
+        width=800,
+        height=600,
+    )
+    output = render('{% img source width=100 alt="Test" %}', source=source)
+    assert output == (
+        '<img src="/image/jpeg100.image"'
+        ' srcset="/image/avif100.image, /image/avif200.image 2x" alt="Test">'
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "attrs, expected",
+    [
+        ('img_class="photo" img_loading="lazy"', 'class="photo" loading="lazy"'),
+        ('img_data_id="1" img_aria_hidden="true"', 'data-id="1" aria-hidden="true"'),
+    ],
+)
+def test_img_attrs(attrs, expected):
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    output = render(f'{{% img source width=100 {attrs} alt="" %}}', source=source)
+    assert output == f'<img {expected} src="/test.jpg" alt="">'
+
+
+@pytest.mark.django_db
+def test_img_as_var():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    output = render(
+        '{% img source width=100 alt="" as thumb %}[{{ thumb }}]', source=source
+    )
+    assert output == '[<img src="/test.jpg" alt="">]'
+
+
+def test_img_requires_alt():
+    with pytest.raises(TemplateSyntaxError):
+        render("{% img source width=100 %}")
+
+
+def test_img_invalid_option():
+    with pytest.raises(TemplateSyntaxError, match="Invalid img option: colour"):
+        render('{% img source width=100 colour="red" alt="" %}')
+
+
+@pytest.mark.django_db
+def test_img_variable_options():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    output = render(
+        '{% img source width=size img_title=title|upper alt="" %}',
+        source=source,
+        size=100,
+        title="test",
+    )
+    assert output == '<img title="TEST" src="/test.jpg" alt="">'
+    assert EasyImage.objects.filter(args__width=100).exists()
+
+
+@pytest.mark.django_db
+def test_img_densities_and_format():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    render(
+        '{% img source width=100 densities="1.5" format="webp" alt="" %}',
+        source=source,
+    )
+    assert set(EasyImage.objects.values_list("args__mimetype", "args__width")) == {
+        ("image/jpeg", 100),
+        ("image/webp", 100),
+        ("image/webp", 150),
+    }
+
+
+@pytest.mark.django_db
+def test_img_unhashable_option():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    render(
+        '{% img source width=100 window=window alt="" %}',
+        source=source,
+        window=[0, 0, 0.5, 0.5],
+    )
+    assert {tuple(image.args["window"]) for image in EasyImage.objects.all()} == {
+        (0, 0, 0.5, 0.5)
+    }
+
+
+@pytest.mark.django_db
+def test_img_cached_options_keep_types():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    render('{% img source width=100 crop=True alt="" %}', source=source)
+    # 1 == True, but it isn't a valid crop value so mustn't hit the cached parse.
+    with pytest.raises(ValueError, match="Invalid crop value 1"):
+        render('{% img source width=100 crop=1 alt="" %}', source=source)
+
+
+@pytest.mark.django_db
+def test_img_instance():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    thumb = Img(width=100, quality=90, densities=[], img_attrs={"class": "thumb"})
+    output = render('{% img source thumb alt="" %}', source=source, thumb=thumb)
+    assert output == '<img class="thumb" src="/test.jpg" alt="">'
+    assert set(EasyImage.objects.values_list("args__width", "args__quality")) == {
+        (100, 90)
+    }
+
+
+@pytest.mark.django_db
+def test_img_instance_with_options():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    thumb = Img(width=100, quality=90, densities=[], img_attrs={"class": "thumb"})
+    output = render(
+        '{% img source thumb width=50 img_loading="lazy" alt="" %}',
+        source=source,
+        thumb=thumb,
+    )
+    assert output == '<img class="thumb" loading="lazy" src="/test.jpg" alt="">'
+    # Only the options given to the tag override the instance's options.
+    assert set(EasyImage.objects.values_list("args__width", "args__quality")) == {
+        (50, 90)
+    }
+
+
+@pytest.mark.django_db
+def test_img_translated_alt():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    output = render('{% img source width=100 alt=_("Photo") %}', source=source)
+    assert output == '<img src="/test.jpg" alt="Photo">'
+
+
+@pytest.mark.django_db
+def test_img_number_densities():
+    source = FieldFile(instance=EasyImage(), field=FileField(), name="test.jpg")
+    render('{% img source width=100 densities=2 alt="" %}', source=source)
+    assert set(EasyImage.objects.values_list("args__mimetype", "args__width")) == {
+        ("image/jpeg", 100),
+        ("image/avif", 100),
+        ("image/avif", 200),
+    }